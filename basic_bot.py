@@ -20,51 +20,127 @@ Notes:
 """
 
 import argparse
+import asyncio
+import atexit
 import hashlib
 import hmac
+import json
 import logging
+import logging.handlers
+import queue
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works fine
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # optional; enables HTTP/2 multiplexing for parallel orders
+    httpx = None
+
+# Network errors from whichever transport is in use
+_TRANSPORT_ERRORS = (requests.RequestException,) if httpx is None else (requests.RequestException, httpx.HTTPError)
+
+
+def _loads(raw: bytes):
+    """Parse a JSON body with orjson when available, stdlib json otherwise."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 # CONFIG
 TESTNET_BASE = "https://testnet.binancefuture.com"
 # OR if it still fails, try the global base:
 # TESTNET_BASE = "https://fapi.binance.com"
 
 ORDER_PATH = "/fapi/v1/order"
+BATCH_ORDER_PATH = "/fapi/v1/batchOrders"
+MAX_BATCH_ORDERS = 5  # Binance limit per batchOrders call
+TWAP_BATCH_WINDOW_S = 0.25  # slices spaced closer than this are sent as one batch
 RECV_WINDOW = 15000  # optional
+CLOCK_RESYNC_INTERVAL_NS = 5 * 60 * 1_000_000_000  # re-measure clock offset every 5 min
+
+_VALID_SIDES = frozenset(("BUY", "SELL"))
+_VALID_TYPES = frozenset(("MARKET", "LIMIT"))
+
+# Canonical key order for order query strings; every value Binance accepts
+# here is ASCII-safe, so percent-quoting is unnecessary.
+_ORDER_KEY_ORDER = ("symbol", "side", "type", "quantity", "reduceOnly", "closePosition",
+                    "positionSide", "price", "timeInForce", "timestamp", "recvWindow")
+_ORDER_KEY_SET = frozenset(_ORDER_KEY_ORDER)
+
+
+def _encode_order_qs(params: dict) -> str:
+    """
+    Build an order query string by plain k=v joining in canonical key order,
+    skipping urllib's quoting machinery. Keys outside the canonical set are
+    appended afterwards so nothing is silently dropped.
+    """
+    parts = []
+    for k in _ORDER_KEY_ORDER:
+        v = params.get(k)
+        if v is not None:
+            parts.append(f"{k}={v}")
+    for k, v in params.items():
+        if k not in _ORDER_KEY_SET and v is not None:
+            parts.append(f"{k}={v}")
+    return "&".join(parts)
+
+# Logging setup.
+# We never log thread/process fields, so skip collecting them per record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
-# Logging setup
 logger = logging.getLogger("BasicBot")
 logger.setLevel(logging.DEBUG)
-fmt = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
+# %(created).3f prints the raw epoch float, avoiding localtime+strftime
+# per record; validate=False skips the style check at format time.
+fmt = logging.Formatter("%(created).3f %(levelname)s: %(message)s", validate=False)
 
 # Console handler (INFO)
 ch = logging.StreamHandler()
 ch.setLevel(logging.INFO)
 ch.setFormatter(fmt)
-logger.addHandler(ch)
 
-# File handlers
-fh = logging.FileHandler("bot.log")
+# File handlers (delay=True: don't open the files until something is logged)
+fh = logging.FileHandler("bot.log", delay=True)
 fh.setLevel(logging.DEBUG)
 fh.setFormatter(fmt)
-logger.addHandler(fh)
 
-# Detailed requests/responses log (sensitive data excluded from printed logs; keys not logged)
-req_fh = logging.FileHandler("bot_requests.log")
+# Detailed requests/responses log (sensitive data excluded from printed logs; keys not logged).
+# Wire-level records are emitted on the "BasicBot.requests" child logger and
+# land only here; bot.log gets everything else — each record is written once.
+req_fh = logging.FileHandler("bot_requests.log", delay=True)
 req_fh.setLevel(logging.DEBUG)
 req_fh.setFormatter(fmt)
-logger.addHandler(req_fh)
+req_fh.addFilter(logging.Filter("BasicBot.requests"))
+fh.addFilter(lambda record: not record.name.startswith("BasicBot.requests"))
+
+# The order thread only enqueues records; formatting and console/file I/O
+# happen on the QueueListener's background thread.
+_log_queue = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, ch, fh, req_fh, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+req_logger = logger.getChild("requests")
 
 
 
 
 class BinanceAPIError(Exception):
-    pass
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
 
 
 class BasicBot:
@@ -72,11 +148,63 @@ class BasicBot:
         self.api_key = api_key
         self.api_secret = api_secret.encode("utf-8")
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({"X-MBX-APIKEY": self.api_key})
+        self.session = self._build_session()
+        # Precomputed HMAC pads: the inner hash has already absorbed the
+        # ipad block, so a fallback signature is just two SHA-256 copy/update
+        # rounds with no HMAC-object bookkeeping. hmac.digest() stays the
+        # primary path on 3.7+.
+        key = self.api_secret
+        if len(key) > 64:  # SHA-256 block size; longer keys get hashed first
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(64, b"\x00")
+        self._hmac_inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._hmac_opad = bytes(b ^ 0x5C for b in key)
         self.dry_run = dry_run
+        # Shared aiohttp session for the async TWAP path; created lazily so
+        # aiohttp stays an optional dependency for the sync-only CLI flow.
+        self._aio_session = None
+        # Local-clock-to-server-clock offset in ms, synced once up front so
+        # signed requests don't pay a /fapi/v1/time round-trip each.
+        self._clock_offset = 0
+        self._last_sync_ns = time.monotonic_ns()
+        if not dry_run:
+            self._sync_clock_offset()
         logger.debug("Initialized BasicBot (dry_run=%s) with base_url=%s", dry_run, self.base_url)
 
+    def _build_session(self):
+        """
+        HTTP/2-capable httpx client when httpx (with the h2 extra) is
+        installed, so parallel orders multiplex over one TLS connection;
+        otherwise a requests session with a widened, retrying adapter.
+        """
+        if httpx is not None:
+            try:
+                return httpx.Client(
+                    http2=True,
+                    timeout=10.0,
+                    headers={"X-MBX-APIKEY": self.api_key},
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                )
+            except ImportError:
+                logger.debug("httpx installed without the h2 extra; using requests")
+        session = requests.Session()
+        # Default adapter caps the pool at 10 sockets and has no retries;
+        # widen it so parallel/TWAP orders reuse keep-alive connections
+        # instead of re-doing TLS handshakes on pool eviction.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers.update({"X-MBX-APIKEY": self.api_key, "Connection": "keep-alive"})
+        return session
+
     def get_server_time(self):
         """Fetch server time from Binance Futures Testnet"""
         url = f"{self.base_url}/fapi/v1/time"
@@ -84,27 +212,109 @@ class BasicBot:
         data = resp.json()
         return data["serverTime"]
 
+    def _sign_qs(self, qs: str) -> str:
+        """Sign an already-encoded query string. Returns signature hex."""
+        if sys.version_info >= (3, 7):
+            # hmac.digest() is a C-level one-shot that skips the Python HMAC wrapper
+            return hmac.digest(self.api_secret, qs.encode("utf-8"), "sha256").hex()
+        inner = self._hmac_inner.copy()
+        inner.update(qs.encode("utf-8"))
+        outer = hashlib.sha256(self._hmac_opad)
+        outer.update(inner.digest())
+        # bytes.hex() beats the HMAC wrapper's hexdigest() formatting path
+        return outer.digest().hex()
+
     def _sign(self, params: dict) -> str:
         """
         Sign parameters with HMAC SHA256 as required by Binance.
         Returns signature hex.
         """
-        qs = urllib.parse.urlencode(params, doseq=True)
-        signature = hmac.new(self.api_secret, qs.encode("utf-8"), hashlib.sha256).hexdigest()
-        return signature
+        return self._sign_qs(urllib.parse.urlencode(params, doseq=True))
 
-    def _timestamped_params(self, extra: dict) -> dict:
-        p = dict(extra)
+    @staticmethod
+    def _build_static_qs(params: dict) -> str:
+        """Encode call-invariant parameters once, outside the hot loop."""
+        return _encode_order_qs(params)
+
+    def _sync_clock_offset(self):
+        """Measure local-vs-server clock skew once; falls back to zero offset."""
         try:
             server_time = self.get_server_time()
-            p["timestamp"] = server_time + 500
+            self._clock_offset = server_time - time.time_ns() // 1_000_000
+            logger.debug("Clock offset vs server: %dms", self._clock_offset)
         except Exception as e:
-            logger.warning("Could not fetch server time, falling back to local time: %s", e)
-            p["timestamp"] = int(time.time() * 1000)
+            logger.warning("Could not sync server time, using local clock: %s", e)
+            self._clock_offset = 0
+        # Monotonic, so wall-clock jumps can't trigger spurious resyncs
+        self._last_sync_ns = time.monotonic_ns()
+
+    def _timestamp(self) -> int:
+        """Server-adjusted timestamp in ms; integer arithmetic only."""
+        if not self.dry_run and time.monotonic_ns() - self._last_sync_ns > CLOCK_RESYNC_INTERVAL_NS:
+            self._sync_clock_offset()
+        return time.time_ns() // 1_000_000 + self._clock_offset + 500
+
+    def _timestamped_params(self, extra: dict) -> dict:
+        p = dict(extra)
+        p["timestamp"] = self._timestamp()
         p["recvWindow"] = RECV_WINDOW
         return p
 
-    def request(self, method: str, path: str, params: dict = None, signed: bool = False) -> dict:
+    def _execute(self, method: str, url: str, full_params) -> dict:
+        """
+        Perform one HTTP exchange and decode the JSON body. Accepts a params
+        dict or a fully signed, pre-encoded query string.
+        Raises BinanceAPIError (with .code when available) on API failures.
+        """
+        # Log request (do not include api secret; signature excluded).
+        # Building the loggable view is not free, so skip it unless DEBUG is on.
+        if req_logger.isEnabledFor(logging.DEBUG):
+            if isinstance(full_params, str):
+                loggable = full_params.split("&signature=")[0]
+            else:
+                loggable = {k: full_params.get(k) for k in full_params if k != "signature"}
+            req_logger.debug("REQUEST --> %s %s params=%s", method.upper(), url, loggable)
+
+        if self.dry_run:
+            logger.info("[DRY RUN] Would send request: %s %s", method.upper(), url)
+            return {"dry_run": True, "method": method, "url": url, "params": full_params}
+
+        if isinstance(full_params, str):
+            # Already fully encoded and signed: splice it into the URL so
+            # requests doesn't re-walk and re-encode a params mapping.
+            url = f"{url}?{full_params}"
+            full_params = None
+
+        if method.upper() == "GET":
+            resp = self.session.get(url, params=full_params, timeout=10)
+        elif method.upper() == "POST":
+            resp = self.session.post(url, params=full_params, timeout=10)
+        elif method.upper() == "DELETE":
+            resp = self.session.delete(url, params=full_params, timeout=10)
+        else:
+            raise ValueError("Unsupported method: " + method)
+
+        req_logger.debug("HTTP %s %s --> status %s", method.upper(), url, resp.status_code)
+        # resp.content avoids the charset-decode that resp.text would do just
+        # to test for emptiness
+        j = _loads(resp.content) if resp.content else {}
+        req_logger.debug("RESPONSE <-- %s", j)
+
+        code = j.get("code") if isinstance(j, dict) else None
+        # httpx spells requests' resp.ok as resp.is_success
+        ok = resp.is_success if hasattr(resp, "is_success") else resp.ok
+        if not ok:
+            # Binance returns JSON errors with code/msg
+            msg = j.get("msg") or resp.text
+            raise BinanceAPIError(f"HTTP {resp.status_code} error: {msg}", code=code)
+
+        # Binance may still return error fields; check typical schema
+        if code and code < 0:
+            raise BinanceAPIError(f"Binance error: {j}", code=code)
+
+        return j
+
+    def request(self, method: str, path: str, params: dict = None, signed: bool = False, _resync: bool = True) -> dict:
         """
         Send request to Binance testnet/specified base URL.
         Logs request + response.
@@ -114,45 +324,49 @@ class BasicBot:
         url = f"{self.base_url}{path}"
         try:
             if signed:
-                full_params = self._timestamped_params(params)
-                signature = self._sign(full_params)
-                full_params["signature"] = signature
+                # Build and sign the exact query string we will send, so the
+                # encoding work happens once instead of here and again inside
+                # requests.
+                qs = _encode_order_qs(self._timestamped_params(params))
+                full_params = qs + "&signature=" + self._sign_qs(qs)
             else:
                 full_params = params
+            return self._execute(method, url, full_params)
+
+        except BinanceAPIError as e:
+            # Clock drifted outside recvWindow: re-sync the offset and retry once
+            if signed and _resync and e.code == -1021:
+                logger.warning("Timestamp outside recvWindow; re-syncing clock offset and retrying")
+                self._sync_clock_offset()
+                return self.request(method, path, params=params, signed=True, _resync=False)
+            raise
 
-            # Log request (do not include api secret; signature included)
-            logger.debug("REQUEST --> %s %s params=%s", method.upper(), url, {k: full_params.get(k) for k in full_params if k != "signature"})
-
-            if self.dry_run:
-                logger.info("[DRY RUN] Would send request: %s %s", method.upper(), url)
-                return {"dry_run": True, "method": method, "url": url, "params": full_params}
-
-            resp = None
-            if method.upper() == "GET":
-                resp = self.session.get(url, params=full_params, timeout=10)
-            elif method.upper() == "POST":
-                resp = self.session.post(url, params=full_params, timeout=10)
-            elif method.upper() == "DELETE":
-                resp = self.session.delete(url, params=full_params, timeout=10)
-            else:
-                raise ValueError("Unsupported method: " + method)
-
-            logger.debug("HTTP %s %s --> status %s", method.upper(), url, resp.status_code)
-            j = resp.json() if resp.text else {}
-            logger.debug("RESPONSE <-- %s", j)
-
-            if not resp.ok:
-                # Binance returns JSON errors with code/msg
-                msg = j.get("msg") or resp.text
-                raise BinanceAPIError(f"HTTP {resp.status_code} error: {msg}")
+        except _TRANSPORT_ERRORS:
+            logger.exception("Network error during request to %s", url)
+            raise
 
-            # Binance may still return error fields; check typical schema
-            if isinstance(j, dict) and j.get("code") and j.get("code") < 0:
-                raise BinanceAPIError(f"Binance error: {j}")
+    def request_presigned(self, method: str, path: str, static_qs: str, mutable: dict = None, _resync: bool = True) -> dict:
+        """
+        Signed request taking a pre-encoded query string for the parameters
+        that are invariant across calls (e.g. across TWAP slices); only the
+        mutable tail, timestamp and signature are computed per call.
+        """
+        qs = static_qs
+        if mutable:
+            qs += "&" + _encode_order_qs(mutable)
+        qs += f"&timestamp={self._timestamp()}&recvWindow={RECV_WINDOW}"
+        url = f"{self.base_url}{path}"
+        try:
+            return self._execute(method, url, qs + "&signature=" + self._sign_qs(qs))
 
-            return j
+        except BinanceAPIError as e:
+            if _resync and e.code == -1021:
+                logger.warning("Timestamp outside recvWindow; re-syncing clock offset and retrying")
+                self._sync_clock_offset()
+                return self.request_presigned(method, path, static_qs, mutable, _resync=False)
+            raise
 
-        except requests.RequestException as e:
+        except _TRANSPORT_ERRORS:
             logger.exception("Network error during request to %s", url)
             raise
 
@@ -167,9 +381,9 @@ class BasicBot:
         side = side.upper()
         order_type = order_type.upper()
 
-        if side not in {"BUY", "SELL"}:
+        if side not in _VALID_SIDES:
             raise ValueError("side must be BUY or SELL")
-        if order_type not in {"MARKET", "LIMIT"}:
+        if order_type not in _VALID_TYPES:
             raise ValueError("order_type must be MARKET or LIMIT")
 
         params = {
@@ -202,6 +416,23 @@ class BasicBot:
                           reduce_only: bool = False, position_side: Optional[str] = None) -> dict:
         return self.place_order(symbol, side, "LIMIT", quantity, price=price, time_in_force=time_in_force, reduce_only=reduce_only, position_side=position_side)
 
+    def place_batch_orders(self, orders: list) -> list:
+        """
+        Place up to MAX_BATCH_ORDERS orders in one POST /fapi/v1/batchOrders
+        call. `orders` are dicts of Binance order fields (string values).
+        """
+        if not 1 <= len(orders) <= MAX_BATCH_ORDERS:
+            raise ValueError(f"batch must contain 1..{MAX_BATCH_ORDERS} orders")
+        if orjson is not None:
+            payload = orjson.dumps(orders).decode("utf-8")
+        else:
+            payload = json.dumps(orders, separators=(",", ":"))
+        # The JSON payload needs real percent-encoding, unlike plain order params
+        static_qs = "batchOrders=" + urllib.parse.quote(payload)
+        result = self.request_presigned("POST", BATCH_ORDER_PATH, static_qs)
+        logger.info("Batch order result: %s", result)
+        return result
+
     def place_twap_order(self, symbol: str, side: str, quantity: float, slices: int = 5, duration: int = 60):
         """
         Simple TWAP: split quantity into `slices` equal parts and send market orders evenly over `duration` seconds.
@@ -212,21 +443,161 @@ class BasicBot:
         if duration < 0:
             raise ValueError("duration must be >= 0")
 
+        symbol = symbol.upper()
+        side = side.upper()
+        if side not in _VALID_SIDES:
+            raise ValueError("side must be BUY or SELL")
+
         slice_qty = float(quantity) / slices
         interval = duration / slices if slices > 0 else 0
         logger.info("Starting TWAP: %s %s total=%s slices=%s interval=%.2fs slice_qty=%.8f", symbol, side, quantity, slices, interval, slice_qty)
 
-        responses = []
-        for i in range(slices):
+        if slices > 1 and interval <= TWAP_BATCH_WINDOW_S:
+            # All slices fire effectively at once: amortize the HTTP
+            # round-trips via batchOrders instead of N sequential POSTs.
+            order = {
+                "symbol": symbol,
+                "side": side,
+                "type": "MARKET",
+                "quantity": str(slice_qty),
+            }
+            responses = []
+            for start in range(0, slices, MAX_BATCH_ORDERS):
+                n = min(MAX_BATCH_ORDERS, slices - start)
+                try:
+                    batch = self.place_batch_orders([order] * n)
+                    responses.extend(batch if isinstance(batch, list) else [batch])
+                except Exception as e:
+                    logger.exception("TWAP batch starting at slice %d failed", start + 1)
+                    responses.extend([{"error": str(e)}] * n)
+            logger.info("TWAP complete")
+            return responses
+
+        # Everything but quantity/timestamp/signature is identical across
+        # slices; encode it once instead of per order.
+        static_qs = self._build_static_qs({
+            "symbol": symbol,
+            "side": side,
+            "type": "MARKET",
+            "reduceOnly": "false",
+            "closePosition": "false",
+        })
+
+        start = time.monotonic()
+
+        def run_slice(i: int):
+            # Each worker sleeps to its slice's absolute monotonic deadline,
+            # so neither request latency nor a slow sibling slice shifts the
+            # schedule.
+            delay = start + i * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
             logger.info("TWAP slice %d/%d placing market order qty=%s", i + 1, slices, slice_qty)
-            try:
-                resp = self.place_market_order(symbol, side, quantity=slice_qty)
-                responses.append(resp)
-            except Exception as e:
-                logger.exception("TWAP slice %d failed", i + 1)
-                responses.append({"error": str(e)})
-            if i < slices - 1 and interval > 0:
-                time.sleep(interval)
+            return self.request_presigned("POST", ORDER_PATH, static_qs, {"quantity": slice_qty})
+
+        # Threads release the GIL around network I/O, so overlapping slices
+        # run in parallel on the shared pooled session.
+        responses = [None] * slices
+        with ThreadPoolExecutor(max_workers=min(slices, 8)) as ex:
+            futures = {ex.submit(run_slice, i): i for i in range(slices)}
+            for fut in as_completed(futures):
+                i = futures[fut]
+                try:
+                    resp = fut.result()
+                    logger.info("Order result: %s", resp)
+                    responses[i] = resp
+                except Exception as e:
+                    logger.exception("TWAP slice %d failed", i + 1)
+                    responses[i] = {"error": str(e)}
+        logger.info("TWAP complete")
+        return responses
+
+    async def _get_aio_session(self):
+        """Lazily create the one shared aiohttp session (a session per request
+        would redo TCP/TLS setup every call)."""
+        import aiohttp
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={"X-MBX-APIKEY": self.api_key},
+            )
+        return self._aio_session
+
+    async def aclose(self):
+        """Close the shared aiohttp session, if one was created."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+
+    async def _aplace_order(self, params: dict) -> dict:
+        """Async counterpart of request("POST", ORDER_PATH, signed=True)."""
+        # Stringify values before signing so the signed query string matches
+        # what aiohttp actually sends.
+        full_params = {k: str(v) for k, v in self._timestamped_params(params).items()}
+        full_params["signature"] = self._sign(full_params)
+        url = f"{self.base_url}{ORDER_PATH}"
+        if req_logger.isEnabledFor(logging.DEBUG):
+            req_logger.debug("REQUEST --> POST %s params=%s", url, {k: full_params[k] for k in full_params if k != "signature"})
+
+        if self.dry_run:
+            logger.info("[DRY RUN] Would send request: POST %s", url)
+            return {"dry_run": True, "method": "POST", "url": url, "params": full_params}
+
+        session = await self._get_aio_session()
+        async with session.post(url, params=full_params) as resp:
+            raw = await resp.read()
+            j = _loads(raw) if raw else {}
+            req_logger.debug("RESPONSE <-- %s", j)
+            if not resp.ok:
+                msg = j.get("msg") if isinstance(j, dict) else None
+                raise BinanceAPIError(f"HTTP {resp.status} error: {msg or raw!r}")
+            if isinstance(j, dict) and j.get("code") and j.get("code") < 0:
+                raise BinanceAPIError(f"Binance error: {j}")
+            return j
+
+    async def place_twap_order_async(self, symbol: str, side: str, quantity: float, slices: int = 5, duration: int = 60):
+        """
+        Async TWAP: schedule every slice up front and run them concurrently on
+        one shared aiohttp session, so wall clock is the schedule plus a single
+        call's latency rather than the sum of sequential round-trips.
+        """
+        if slices < 1:
+            raise ValueError("slices must be >= 1")
+        if duration < 0:
+            raise ValueError("duration must be >= 0")
+
+        symbol = symbol.upper()
+        side = side.upper()
+        if side not in _VALID_SIDES:
+            raise ValueError("side must be BUY or SELL")
+
+        slice_qty = float(quantity) / slices
+        interval = duration / slices if slices > 0 else 0
+        logger.info("Starting async TWAP: %s %s total=%s slices=%s interval=%.2fs slice_qty=%.8f", symbol, side, quantity, slices, interval, slice_qty)
+
+        async def run_slice(i: int):
+            if interval > 0 and i:
+                await asyncio.sleep(i * interval)
+            logger.info("TWAP slice %d/%d placing market order qty=%s", i + 1, slices, slice_qty)
+            return await self._aplace_order({
+                "symbol": symbol,
+                "side": side,
+                "type": "MARKET",
+                "quantity": slice_qty,
+                "reduceOnly": "false",
+                "closePosition": "false",
+            })
+
+        tasks = [asyncio.create_task(run_slice(i)) for i in range(slices)]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        responses = []
+        for i, r in enumerate(results):
+            if isinstance(r, Exception):
+                logger.error("TWAP slice %d failed: %s", i + 1, r)
+                responses.append({"error": str(r)})
+            else:
+                responses.append(r)
         logger.info("TWAP complete")
         return responses
 